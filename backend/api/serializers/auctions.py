@@ -1,3 +1,7 @@
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.utils import timezone
 
@@ -13,54 +17,91 @@ from auction.models import Sale
 from api.serializers.auth import UserSerializer
 from api.serializers.entities import ProductSerializer
 from api.serializers.entities import ProductDetailSerializer
+from api.serializers.mixins import CachedFieldsSerializerMixin
 from api.serializers.mixins import TagnamesSerializerMixin
 from history.constants import HISTORY_RECORD_AUCTION_NEW
 from history.constants import HISTORY_RECORD_USER_BID
 from history.models import HistoryRecord
 from notification.constants import NOTIFICATION_AUCTION_NEW_BID
-from notification.email import send_email
+from notification.email import send_email_async
 from notification.models import Notification
 
 
-class AuctionSerializer(serializers.ModelSerializer):
-    product_details = serializers.SerializerMethodField()
-
+class AuctionSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializer used for auction lists, with representation built inline rather than field by field
+    """
     class Meta:
         model = Auction
         fields = (
             'pk',
             'title', 'starting_price', 'product',
-            'current_price', 'status', 'started_at', 'open_until', 'ended_at', 'product_details'
+            'current_price', 'status', 'started_at', 'open_until', 'ended_at'
         )
-        read_only_fields = ('pk', 'current_price', 'status', 'started_at', 'ended_at', 'product_details')
+        read_only_fields = ('pk', 'current_price', 'status', 'started_at', 'ended_at')
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return queryset \
+            .select_related('product') \
+            .select_related('product__donor') \
+            .prefetch_related('product__donor__charities') \
+            .prefetch_related('product__media')
+
+    def to_representation(self, obj):
+        fields = self.fields
+        return OrderedDict((
+            ('pk', obj.pk),
+            ('title', obj.title),
+            ('starting_price', obj.starting_price),
+            ('product', obj.product_id),
+            ('current_price', obj.current_price),
+            ('status', obj.status),
+            ('started_at', fields['started_at'].to_representation(obj.started_at)),
+            ('open_until', fields['open_until'].to_representation(obj.open_until)),
+            ('ended_at', fields['ended_at'].to_representation(obj.ended_at)),
+            ('product_details', self.get_product_details(obj)),
+        ))
 
     def get_product_details(self, obj):
-        serializer = ProductDetailSerializer(obj.product)
-        return serializer.data
+        product_cache = self.context.setdefault('_product_details_cache', {})
+        if obj.product_id not in product_cache:
+            if '_product_details_serializer' not in self.context:
+                self.context['_product_details_serializer'] = ProductDetailSerializer()
+            serializer = self.context['_product_details_serializer']
+            product_cache[obj.product_id] = serializer.to_representation(obj.product)
+        return product_cache[obj.product_id]
 
 
 class AuctionAdminSerializer(AuctionSerializer):
     """
     Serializer used for Admin AuctionListView and AuctionDetailView
     """
-    highest_bidder = serializers.SerializerMethodField()
-
     class Meta:
         model = Auction
         fields = AuctionSerializer.Meta.fields + (
-            'charity', 'max_bid', 'min_bid', 'highest_bidder', 'number_of_bids', 'time_remaining'
+            'charity', 'max_bid', 'min_bid', 'number_of_bids', 'time_remaining'
         )
         read_only_fields = (
-            'pk', 'current_price', 'started_at', 'ended_at', 'product_details',
-            'max_bid', 'min_bid', 'highest_bidder', 'number_of_bids', 'time_remaining',
+            'pk', 'current_price', 'started_at', 'ended_at',
+            'max_bid', 'min_bid', 'number_of_bids', 'time_remaining',
         )
 
+    def to_representation(self, obj):
+        data = super(AuctionAdminSerializer, self).to_representation(obj)
+        data['charity'] = obj.charity_id
+        data['max_bid'] = obj.max_bid
+        data['min_bid'] = obj.min_bid
+        data['highest_bidder'] = self.get_highest_bidder(obj)
+        data['number_of_bids'] = obj.number_of_bids
+        data['time_remaining'] = obj.time_remaining
+        return data
+
     def get_highest_bidder(self, obj):
-        try:
-            user = obj.highest_bid.user
-            return user.email
-        except:
+        highest_bid = obj.highest_bid
+        if highest_bid is None:
             return None
+        return highest_bid.user.email
 
     def create(self, *args, **kwargs):
         instance = super(AuctionAdminSerializer, self).create(*args, **kwargs)
@@ -68,7 +109,7 @@ class AuctionAdminSerializer(AuctionSerializer):
         return instance
 
 
-class AuctionDetailWithSimilarSerializer(serializers.ModelSerializer):
+class AuctionDetailWithSimilarSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """
     Serializer used in front api for serializing Auction model object, with data on similar auctions
     """
@@ -94,45 +135,49 @@ class StartAuctionSerializer(serializers.Serializer):
     duration_hours = serializers.IntegerField(required=False, min_value=0)
     duration_minutes = serializers.IntegerField(required=False, min_value=0)
 
+    DURATION_FIELDS = frozenset(('duration_days', 'duration_hours', 'duration_minutes'))
+
     def validate(self, data):
         data = super(StartAuctionSerializer, self).validate(data)
+        duration_keys = data.keys() & self.DURATION_FIELDS
+        now = timezone.now()
 
-        if ('open_until' not in data and
-                'duration_days' not in data and
-                'duration_hours' not in data and
-                'duration_minutes' not in data):
+        if 'open_until' not in data and not duration_keys:
             raise serializers.ValidationError('open_until field or at least one of duration fields should be provided')
 
-        if ('open_until' in data and
-                ('duration_days' in data or 'duration_hours' in data or 'duration_minutes' in data)):
-            raise serializers.ValidationError(
-                'open_until field and duration fields should not be provided at the same time'
-            )
-
-        if 'open_until' in data and data['open_until'] <= timezone.now():
-            raise serializers.ValidationError(
-                'open_until field cannot be past or present datetime'
-            )
-
-        if ('open_until' not in data and
-                ('duration_days' not in data or int(data['duration_days']) == 0) and
-                ('duration_hours' not in data or int(data['duration_hours']) == 0) and
-                ('duration_minutes' not in data or int(data['duration_minutes']) == 0)):
-            raise serializers.ValidationError(
-                'At least of one of duration fields should be larger than zero'
+        if 'open_until' in data:
+            if duration_keys:
+                raise serializers.ValidationError(
+                    'open_until field and duration fields should not be provided at the same time'
+                )
+
+            if data['open_until'] <= now:
+                raise serializers.ValidationError(
+                    'open_until field cannot be past or present datetime'
+                )
+        else:
+            if not any(int(data[key]) > 0 for key in duration_keys):
+                raise serializers.ValidationError(
+                    'At least of one of duration fields should be larger than zero'
+                )
+
+            data['open_until'] = now + timedelta(
+                days=data.get('duration_days', 0),
+                hours=data.get('duration_hours', 0),
+                minutes=data.get('duration_minutes', 0),
             )
 
         return data
 
 
-class BidSerializer(serializers.ModelSerializer):
+class BidSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Bid
         fields = ('pk', 'price', 'status', 'placed_at', 'closed_at', 'user', 'auction')
         read_only_fields = ('pk', 'status', 'placed_at', 'closed_at', 'user', 'auction')
 
     def validate_price(self, value):
-        auction = self.context.get('view').get_object()
+        auction = self.context['auction']
         if value <= auction.current_price:
             raise serializers.ValidationError('Price should be higher than current price of this auction')
 
@@ -140,12 +185,13 @@ class BidSerializer(serializers.ModelSerializer):
 
     def validate(self, data):
         data = super(BidSerializer, self).validate(data)
-        auction = self.context.get('view').get_object()
+        auction = self.context['auction']
+        now = timezone.now()
 
         if auction.status != AUCTION_STATUS_OPEN:
             raise serializers.ValidationError('Bids can be placed to open auctions only')
 
-        if auction.open_until and auction.open_until < timezone.now():
+        if auction.open_until and auction.open_until < now:
             raise serializers.ValidationError('This auction is now waiting to close')
 
         return data
@@ -154,57 +200,51 @@ class BidSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         request = self.context.get('request')
         user = request.user
-        auction = self.context.get('view').get_object()
+        auction = self.context['auction']
         price = validated_data['price']
         placed_at = timezone.now()
 
-        try:
-            bid = Bid.objects.get(user=user, auction=auction)
-            bid.price = price
-            bid.placed_at = placed_at
-            bid.save()
-        except Bid.DoesNotExist:
-            bid = Bid.objects.create(
-                price=price,
-                placed_at=placed_at,
-                user=user,
-                auction=auction
-            )
-        except Bid.MultipleObjectsReturned:
-            Bid.objects.filter(user=user).filter(auction=auction).delete()
-            bid = Bid.objects.create(
-                price=price,
-                placed_at=placed_at,
-                user=user,
-                auction=auction
-            )
+        bid, created = Bid.objects.update_or_create(
+            user=user,
+            auction=auction,
+            defaults={
+                'price': price,
+                'placed_at': placed_at,
+            }
+        )
 
         HistoryRecord.objects.create_history_record(user, auction, HISTORY_RECORD_USER_BID, {
             'price': price,
             'placed_at': placed_at,
         })
 
-        bids = auction.bid_set.filter(status=BID_STATUS_ACTIVE).select_related('user')
+        recipients = auction.bid_set \
+            .filter(status=BID_STATUS_ACTIVE) \
+            .exclude(user_id=user.pk) \
+            .values_list('user_id', 'user__email')
+        user_pks = []
         user_emails = []
 
-        for bid in bids:
-            if bid.user.pk != user.pk:
-                Notification.objects.create_notification(bid.user, auction, NOTIFICATION_AUCTION_NEW_BID, {
-                    'price': price,
-                    'placed_at': placed_at,
-                })
-                user_emails.append(bid.user.email)
+        for user_pk, email in recipients:
+            user_pks.append(user_pk)
+            user_emails.append(email)
+
+        Notification.objects.create_notifications(get_user_model(), user_pks, auction, NOTIFICATION_AUCTION_NEW_BID, {
+            'price': price,
+            'placed_at': placed_at,
+        })
 
-        send_email(
+        send_email_async(
             'New bid has been placed',
-            'A new bid has been placed on auction {}'.format(auction.title),
-            user_emails
+            f'A new bid has been placed on auction {auction.title}',
+            [],
+            bcc=user_emails
         )
 
         return bid
 
 
-class BidDetailSerializer(serializers.ModelSerializer):
+class BidDetailSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     user_detail = UserSerializer(source='user')
     auction_details = AuctionSerializer(source='auction')
 
@@ -214,30 +254,24 @@ class BidDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ('pk', 'price', 'status', 'placed_at', 'closed_at', 'user', 'user_detail', 'auction', 'auction_details')
 
 
-class BidWithUserDetailSerializer(serializers.ModelSerializer):
-    user_detail = serializers.SerializerMethodField()
+class BidWithUserDetailSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
+    user_detail = UserSerializer(source='user', read_only=True)
 
     class Meta:
         model = Bid
         fields = ('pk', 'price', 'status', 'placed_at', 'closed_at', 'user', 'user_detail', 'auction')
         read_only_fields = ('pk', 'price', 'status', 'placed_at', 'closed_at', 'user', 'user_detail', 'auction')
 
-    def get_user_detail(self, obj):
-        return UserSerializer(obj.user).data
-
 
-class BidStatusChangeSerializer(serializers.ModelSerializer):
+class BidStatusChangeSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     active = serializers.BooleanField(write_only=True)
-    user_detail = serializers.SerializerMethodField()
+    user_detail = UserSerializer(source='user', read_only=True)
 
     class Meta:
         model = Bid
         fields = ('pk', 'price', 'status', 'placed_at', 'closed_at', 'user', 'user_detail', 'auction', 'active')
         read_only_fields = ('pk', 'price', 'status', 'placed_at', 'closed_at', 'user', 'user_detail', 'auction')
 
-    def get_user_detail(self, obj):
-        return UserSerializer(obj.user).data
-
     def update(self, instance, validated_data):
         target_status = BID_STATUS_ACTIVE if validated_data['active'] else BID_STATUS_REJECTED
 
@@ -247,13 +281,13 @@ class BidStatusChangeSerializer(serializers.ModelSerializer):
         if instance.status == target_status:
             raise ParseError('Invalid status change')
 
+        Bid.objects.filter(pk=instance.pk).update(status=target_status)
         instance.status = target_status
-        instance.save()
 
         return instance
 
 
-class SaleSerializer(serializers.ModelSerializer):
+class SaleSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     winner = serializers.SerializerMethodField()
     charity = serializers.SerializerMethodField()
 
@@ -266,11 +300,20 @@ class SaleSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('pk', 'winner', 'price', 'charity', 'note')
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return queryset \
+            .select_related('user') \
+            .select_related('auction__charity')
+
     def get_winner(self, obj):
-        return '{} {}'.format(obj.user.first_name, obj.user.last_name)
+        return f'{obj.user.first_name} {obj.user.last_name}'
 
     def get_charity(self, obj):
-        return obj.auction.charity.title
+        auction = obj.auction
+        if auction is None or auction.charity_id is None:
+            return None
+        return auction.charity.title
 
 
 class SaleNoteSerializer(SaleSerializer):
@@ -280,7 +323,7 @@ class SaleNoteSerializer(SaleSerializer):
         read_only_fields = ('pk', 'winner', 'price', 'charity', 'item_sent', 'tracking_number', 'status')
 
 
-class AuctionBacklogSerializer(serializers.ModelSerializer):
+class AuctionBacklogSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     highest_bid = BidWithUserDetailSerializer()
     product = ProductDetailSerializer()
     sale = SaleSerializer()
@@ -289,3 +332,17 @@ class AuctionBacklogSerializer(serializers.ModelSerializer):
         model = Auction
         fields = ('pk', 'title', 'status', 'highest_bid', 'product', 'sale')
         read_only_fields = ('pk', 'title', 'status', 'highest_bid', 'product', 'sale')
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Reverse one-to-one select_related caches the auction on its sale, so selecting charity here
+        also covers SaleSerializer.get_charity
+        """
+        return queryset \
+            .select_related('charity') \
+            .select_related('sale__user') \
+            .select_related('product') \
+            .select_related('product__donor') \
+            .prefetch_related('product__donor__charities') \
+            .prefetch_related('product__media')
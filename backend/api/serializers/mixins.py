@@ -1,3 +1,7 @@
+from collections import OrderedDict
+from copy import copy
+from copy import deepcopy
+
 from django.db import transaction
 
 from rest_framework import serializers
@@ -26,3 +30,36 @@ class TagnamesSerializerMixin(object):
         instance = super(TagnamesSerializerMixin, self).update(instance, validated_data)
         Tag.objects.update_tags(instance, ','.join(tagnames))
         return instance
+
+
+class CachedFieldsSerializerMixin(object):
+    """
+    Builds serializer fields once per class and hands out copies of them afterwards.
+    Fields that bind a child (nested serializers, many related fields, list and dict fields) are deep copied
+    so the child is never shared between instances, and validators are copied as some keep per-call state.
+    """
+    _fields_cache = {}
+    _deep_copied_field_classes = (
+        serializers.BaseSerializer,
+        serializers.ManyRelatedField,
+        serializers.ListField,
+        serializers.DictField,
+    )
+
+    def get_fields(self):
+        cls = self.__class__
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super(CachedFieldsSerializerMixin, self).get_fields()
+
+        return OrderedDict(
+            (field_name, self._copy_field(field))
+            for field_name, field in self._fields_cache[cls].items()
+        )
+
+    def _copy_field(self, field):
+        if isinstance(field, self._deep_copied_field_classes):
+            return deepcopy(field)
+
+        field_copy = copy(field)
+        field_copy.validators = [copy(validator) for validator in field.validators]
+        return field_copy
@@ -16,6 +16,8 @@ from auction.constants import AUCTION_STATUS_FINISHED
 from auction.models import Auction
 from auction.test.factories import AuctionFactory
 from auction.test.factories import BidFactory
+from notification.constants import NOTIFICATION_AUCTION_NEW_BID
+from notification.models import Notification
 
 
 class AuctionAdminSerializerTests(SerializerTestCase):
@@ -34,12 +36,31 @@ class AuctionAdminSerializerTests(SerializerTestCase):
     def test_get_single(self):
         serializer = self.get_serializer(self.auction)
         self.assertIn('pk', serializer.data)
+        self.assertIn('product_details', serializer.data)
+        self.assertEqual(serializer.data['number_of_bids'], 2)
+        self.assertEqual(serializer.data['highest_bidder'], self.bids[1].user.email)
 
     def test_get_list(self):
         auction_queryset = Auction.objects.all()
         serializer = self.get_serializer(auction_queryset, many=True)
         self.assertEqual(len(serializer.data), 2)
 
+    def test_fields_are_not_shared_between_instances(self):
+        first_serializer = self.get_serializer(self.auction)
+        second_serializer = self.get_serializer(self.auction2)
+        self.assertEqual(list(first_serializer.fields), list(second_serializer.fields))
+        self.assertIsNot(first_serializer.fields['title'], second_serializer.fields['title'])
+        self.assertEqual(first_serializer.data['pk'], self.auction.pk)
+        self.assertEqual(second_serializer.data['pk'], self.auction2.pk)
+
+    def test_field_validators_are_not_shared_between_instances(self):
+        first_validators = self.get_serializer(self.auction).fields['product'].validators
+        second_validators = self.get_serializer(self.auction2).fields['product'].validators
+        self.assertTrue(first_validators)
+        self.assertEqual(len(first_validators), len(second_validators))
+        for first_validator, second_validator in zip(first_validators, second_validators):
+            self.assertIsNot(first_validator, second_validator)
+
 
 @patch('django.utils.timezone.now', return_value=timezone.make_aware(datetime(2017, 11, 1)))
 class StartAuctionSerializerTests(SerializerTestCase):
@@ -60,6 +81,7 @@ class StartAuctionSerializerTests(SerializerTestCase):
         }
         serializer = self.get_serializer(data=data)
         self.assertValid(serializer)
+        self.assertEqual(serializer.validated_data['open_until'], timezone.now() + timedelta(days=2))
 
     def test_validation_fails_with_both_fields(self, mock_now):
         data = {
@@ -98,14 +120,8 @@ class BidSerializerTests(SerializerTestCase):
         }
 
     def get_context(self):
-        class MockView():
-            def get_object(s):
-                return self.auction
-
-        view = MockView()
-
         return {
-            'view': view,
+            'auction': self.auction,
         }
 
     def test_place_bid_successes(self, mock_now):
@@ -115,6 +131,31 @@ class BidSerializerTests(SerializerTestCase):
         bid = serializer.create(serializer.validated_data)
         self.assertIsNotNone(bid)
 
+    def test_place_bid_twice_updates_existing_bid(self, mock_now):
+        serializer = self.get_serializer(data=self.get_data(), context=self.get_context())
+        self.assertValid(serializer)
+        first_bid = serializer.create(serializer.validated_data)
+
+        serializer = self.get_serializer(data=self.get_data(), context=self.get_context())
+        self.assertValid(serializer)
+        second_bid = serializer.create(serializer.validated_data)
+
+        self.assertEqual(first_bid.pk, second_bid.pk)
+        self.assertEqual(self.auction.bid_set.filter(user=self.user).count(), 1)
+
+    @patch('notification.signals.AuctionChannel.send')
+    def test_place_bid_notifies_other_bidders(self, mock_send, mock_now):
+        BidFactory.create(auction=self.auction)
+        BidFactory.create(auction=self.auction)
+
+        serializer = self.get_serializer(data=self.get_data(), context=self.get_context())
+        self.assertValid(serializer)
+
+        bid = serializer.create(serializer.validated_data)
+        self.assertEqual(bid.user, self.user)
+        self.assertEqual(Notification.objects.filter(action=NOTIFICATION_AUCTION_NEW_BID).count(), 2)
+        self.assertEqual(mock_send.call_count, 2)
+
     def test_lower_bid_fails(self, mock_now):
         data = self.get_data()
         data['price'] = self.auction.current_price - 100
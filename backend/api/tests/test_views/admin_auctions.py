@@ -2,6 +2,7 @@ import json
 from unittest.mock import MagicMock, patch
 from datetime import timedelta
 
+from django.contrib.contenttypes.models import ContentType
 from django.urls import reverse
 from django.utils import timezone
 
@@ -17,7 +18,10 @@ from auction.constants import BID_STATUS_REJECTED
 from auction.models import Auction
 from auction.test.factories import AuctionFactory
 from auction.test.factories import BidFactory
+from auction.test.factories import SaleFactory
 from common.test import AdminAPITestCase
+from entity.models import Product
+from entity.test.factories import CharityFactory
 
 
 class AuctionDetailViewTests(AdminAPITestCase):
@@ -169,3 +173,66 @@ class AuctionBidStatusChangeViewTests(AdminAPITestCase):
 
         self.bid.refresh_from_db()
         self.assertEqual(self.bid.status, BID_STATUS_ACTIVE)
+
+
+class SaleListViewTests(AdminAPITestCase):
+    def setUp(self):
+        super(SaleListViewTests, self).setUp()
+        self.sales = [
+            SaleFactory.create(auction__charity=CharityFactory.create())
+            for _ in range(3)
+        ]
+
+    def test_sale_list_queries(self):
+        # pagination count and sales with user and auction charity joined
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('api:admin:sale-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+        self.assertEqual(len(response.data['results']), 3)
+
+
+class SaleDetailViewTests(AdminAPITestCase):
+    def test_sale_charity(self):
+        sale = SaleFactory.create(auction__charity=CharityFactory.create())
+
+        # sale with user and auction charity joined
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('api:admin:sale-detail', kwargs=dict(pk=sale.pk)))
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+        self.assertEqual(response.data['charity'], sale.auction.charity.title)
+
+    def test_sale_without_charity(self):
+        sale = SaleFactory.create()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('api:admin:sale-detail', kwargs=dict(pk=sale.pk)))
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+        self.assertIsNone(response.data['charity'])
+
+    def test_sale_without_auction(self):
+        sale = SaleFactory.create(auction=None, product=None)
+
+        response = self.client.get(reverse('api:admin:sale-detail', kwargs=dict(pk=sale.pk)))
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+        self.assertIsNone(response.data['charity'])
+
+class AuctionBacklogListViewTests(AdminAPITestCase):
+    def setUp(self):
+        super(AuctionBacklogListViewTests, self).setUp()
+        self.sales = [
+            SaleFactory.create(auction__charity=CharityFactory.create())
+            for _ in range(3)
+        ]
+        for sale in self.sales:
+            BidFactory.create(auction=sale.auction, user=sale.user)
+
+        # the product media prefetch looks up the content type, which is cached across tests
+        ContentType.objects.get_for_model(Product)
+
+    def test_backlog_list_queries(self):
+        # pagination count, auctions with sale, charity and product joined, donor charities and product media
+        # prefetches, then per auction: highest bid (2), bidder payment info, donor charity logos (2) and product tags
+        with self.assertNumQueries(4 + 3 * 6):
+            response = self.client.get(reverse('api:admin:backlog'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+        self.assertEqual(len(response.data['results']), 3)
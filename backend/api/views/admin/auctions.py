@@ -1,9 +1,7 @@
 import random
-from datetime import timedelta
 
 from django.db import transaction
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
 
 from rest_framework import generics
 from rest_framework import views
@@ -31,11 +29,7 @@ from common.exceptions import PaymentRequired
 
 class AuctionListView(generics.ListCreateAPIView):
     permission_classes = (IsAuthenticated, IsAdmin,)
-    queryset = Auction.objects.order_by('pk') \
-        .select_related('product') \
-        .select_related('product__donor') \
-        .prefetch_related('product__donor__charities') \
-        .prefetch_related('product__media')
+    queryset = AuctionAdminSerializer.setup_eager_loading(Auction.objects.order_by('pk'))
     serializer_class = AuctionAdminSerializer
     pagination_class = TenPerPagePagination
     filter_backends = (StatusFilterBackend, )
@@ -45,7 +39,7 @@ class AuctionDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = (IsAuthenticated, IsAdmin,)
     serializer_class = AuctionAdminSerializer
     lookup_url_kwarg = 'pk'
-    queryset = Auction.objects.select_related('product')
+    queryset = AuctionAdminSerializer.setup_eager_loading(Auction.objects.all())
 
     def destroy(self, *args, **kwargs):
         auction = self.get_object()
@@ -63,17 +57,9 @@ class AuctionStartView(generics.GenericAPIView):
     def post(self, *args, **kwargs):
         serializer = StartAuctionSerializer(data=self.request.data)
         serializer.is_valid(raise_exception=True)
-        if serializer.validated_data['open_until']:
-            open_until = serializer.validated_data['open_until']
-        else:
-            open_until = timezone.now() + timedelta(
-                days=serializer.validated_data['duration_days'],
-                hours=serializer.validated_data['duration_hours'],
-                minutes=serializer.validated_data['duration_minutes'],
-            )
 
         auction = self.get_object()
-        auction.start(open_until)
+        auction.start(serializer.validated_data['open_until'])
 
         serializer = self.get_serializer(auction)
         return Response(serializer.data)
@@ -125,14 +111,12 @@ class AuctionBidStatusChangeView(generics.UpdateAPIView):
 
     def get_queryset(self):
         auction_pk = self.kwargs.get('pk', None)
-        return Bid.objects.filter(auction=auction_pk)
+        return Bid.objects.filter(auction=auction_pk).select_related('user')
 
 
 class SaleListView(generics.ListAPIView):
     permission_classes = (IsAuthenticated, IsAdmin,)
-    queryset = Sale.objects.order_by('pk') \
-        .prefetch_related('product__donor__charities') \
-        .select_related('user')
+    queryset = SaleSerializer.setup_eager_loading(Sale.objects.order_by('pk'))
     serializer_class = SaleSerializer
     pagination_class = TenPerPagePagination
 
@@ -141,24 +125,19 @@ class SaleDetailView(generics.RetrieveUpdateAPIView):
     permission_classes = (IsAuthenticated, IsAdmin,)
     serializer_class = SaleSerializer
     lookup_url_kwarg = 'pk'
-    queryset = Sale.objects.all()
+    queryset = SaleSerializer.setup_eager_loading(Sale.objects.all())
 
 
 class SaleNoteView(generics.UpdateAPIView):
     permission_classes = (IsAuthenticated, IsAdmin,)
     serializer_class = SaleNoteSerializer
     lookup_url_kwarg = 'pk'
-    queryset = Sale.objects.all()
+    queryset = SaleNoteSerializer.setup_eager_loading(Sale.objects.all())
 
 
 class AuctionBacklogListView(generics.ListAPIView):
     permission_classes = (IsAuthenticated, IsAdmin,)
-    queryset = Auction.objects.order_by('pk') \
-        .select_related('sale') \
-        .select_related('product') \
-        .select_related('product__donor') \
-        .prefetch_related('product__donor__charities') \
-        .prefetch_related('product__media')
+    queryset = AuctionBacklogSerializer.setup_eager_loading(Auction.objects.order_by('pk'))
     serializer_class = AuctionBacklogSerializer
     pagination_class = TenPerPagePagination
     filter_backends = (StatusFilterBackend, )
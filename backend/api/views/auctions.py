@@ -27,10 +27,7 @@ class AuctionFrontListView(generics.ListAPIView):
     serializer_class = AuctionSerializer
     pagination_class = FourPerPagePagination
     filter_backends = (AuctionCategoryFilterBackend, )
-    queryset = Auction.objects.order_by('-started_at') \
-        .select_related('product') \
-        .select_related('product__donor') \
-        .prefetch_related('product__media')
+    queryset = AuctionSerializer.setup_eager_loading(Auction.objects.order_by('-started_at'))
 
 
 class AuctionListView(generics.ListAPIView):
@@ -43,10 +40,7 @@ class AuctionListView(generics.ListAPIView):
         AuctionPriceRangeFilterBackend,
         AuctionQueryFilterBackend,
     )
-    queryset = Auction.objects.order_by('-started_at') \
-        .select_related('product') \
-        .select_related('product__donor') \
-        .prefetch_related('product__media')
+    queryset = AuctionSerializer.setup_eager_loading(Auction.objects.order_by('-started_at'))
 
 
 class AuctionDetailView(generics.RetrieveAPIView):
@@ -64,6 +58,11 @@ class AuctionPlaceBidView(generics.CreateAPIView):
     queryset = Auction.objects.select_related('product') \
         .select_related('product__donor')
 
+    def get_serializer_context(self):
+        context = super(AuctionPlaceBidView, self).get_serializer_context()
+        context['auction'] = self.get_object()
+        return context
+
 
 class AccountBidListView(generics.ListAPIView):
     permission_classes = (IsAuthenticated, )
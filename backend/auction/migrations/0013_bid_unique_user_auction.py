@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+from django.db.models import Count
+from django.utils import timezone
+
+
+def forwards(apps, schema_editor):
+    Bid = apps.get_model('auction', 'Bid')
+    alive_bids = Bid.objects.filter(deleted_at=None)
+    duplicates = alive_bids.values('user', 'auction').annotate(count=Count('pk')).filter(count__gt=1)
+    for duplicate in duplicates:
+        bids = alive_bids.filter(user=duplicate['user'], auction=duplicate['auction']).order_by('-placed_at', '-pk')
+        bids.exclude(pk=bids.first().pk).update(deleted_at=timezone.now())
+
+
+def reverse(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auction', '0012_auction_charity'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, reverse),
+        migrations.RunSQL(
+            'CREATE UNIQUE INDEX auction_bid_user_auction_alive_uniq '
+            'ON auction_bid (user_id, auction_id) WHERE deleted_at IS NULL',
+            'DROP INDEX auction_bid_user_auction_alive_uniq',
+        ),
+    ]
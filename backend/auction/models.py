@@ -280,6 +280,9 @@ class Auction(models.Model):
 
 
 class Bid(SoftDeletionModel):
+    """
+    A user has at most one alive bid per auction, enforced by a partial unique index (migration 0013)
+    """
     price = models.FloatField()
     status = models.CharField(
         choices=BID_STATUS_CHOICES,
@@ -10,6 +10,7 @@ from auction.constants import AUCTION_STATUS_PREVIEW
 from auction.constants import BID_STATUS_ACTIVE
 from auction.models import Auction
 from auction.models import Bid
+from auction.models import Sale
 from entity.test.factories import ProductFactory
 
 
@@ -39,6 +40,20 @@ class BidFactory(factory.DjangoModelFactory):
     auction = factory.SubFactory(AuctionFactory)
 
 
+class SaleFactory(factory.DjangoModelFactory):
+    class Meta:
+        model = Sale
+
+    price = 12000
+    stripe_charge_id = factory.Sequence(
+        lambda n: 'ch_{}'.format(1000000 + n)
+    )
+
+    auction = factory.SubFactory(AuctionFactory)
+    product = factory.SelfAttribute('auction.product')
+    user = factory.SubFactory(UserFactory)
+
+
 class CustomerFactory(factory.DjangoModelFactory):
     class Meta:
         model = Customer
@@ -18,26 +18,39 @@ class HistoryRecordEntity(models.Model):
 
 class HistoryRecordManager(models.Manager):
     def create_history_record(self, subject, target, action, extra=None):
-        if subject:
-            subject_history_record_entity = HistoryRecordEntity()
-            subject_history_record_entity.content_object = subject
-            subject_history_record_entity.save()
-        else:
-            subject_history_record_entity = None
+        return self.create_history_records([(subject, target, action, extra)])[0]
 
-        if target:
-            target_history_record_entity = HistoryRecordEntity()
-            target_history_record_entity.content_object = target
-            target_history_record_entity.save()
-        else:
-            target_history_record_entity = None
+    def create_history_records(self, records):
+        """
+        Create history records from (subject, target, action, extra) tuples,
+        inserting all of their entities in one query and the records in another
+        """
+        entities = []
+        history_records = []
+        for subject, target, action, extra in records:
+            subject_target_entities = []
+            for content_object in (subject, target):
+                if content_object:
+                    history_record_entity = HistoryRecordEntity()
+                    history_record_entity.content_object = content_object
+                    entities.append(history_record_entity)
+                else:
+                    history_record_entity = None
+                subject_target_entities.append(history_record_entity)
+            history_records.append((subject_target_entities, action, extra))
 
-        return self.create(
-            subject=subject_history_record_entity,
-            target=target_history_record_entity,
-            action=action,
-            extra=extra
-        )
+        if entities:
+            HistoryRecordEntity.objects.bulk_create(entities)
+
+        return self.bulk_create([
+            self.model(
+                subject=subject_history_record_entity,
+                target=target_history_record_entity,
+                action=action,
+                extra=extra
+            )
+            for (subject_history_record_entity, target_history_record_entity), action, extra in history_records
+        ])
 
 
 class HistoryRecord(models.Model):
@@ -1,3 +1,33 @@
-from django.test import TestCase
+from account.test.factories import UserFactory
+from auction.test.factories import AuctionFactory
+from common.test import TestCase
+from history.constants import HISTORY_RECORD_AUCTION_NEW
+from history.constants import HISTORY_RECORD_USER_BID
+from history.models import HistoryRecord
+from history.models import HistoryRecordEntity
 
-# Create your tests here.
+
+class HistoryRecordManagerTests(TestCase):
+    def setUp(self):
+        self.user = UserFactory.create()
+        self.auction = AuctionFactory.create()
+
+    def test_create_history_records(self):
+        records = HistoryRecord.objects.create_history_records([
+            (self.user, self.auction, HISTORY_RECORD_USER_BID, {'price': 11000}),
+            (self.auction, None, HISTORY_RECORD_AUCTION_NEW, None),
+        ])
+
+        self.assertEqual(len(records), 2)
+        self.assertEqual(HistoryRecord.objects.count(), 2)
+        self.assertEqual(HistoryRecordEntity.objects.count(), 3)
+
+        bid_record = HistoryRecord.objects.get(action=HISTORY_RECORD_USER_BID)
+        self.assertEqual(bid_record.subject.content_object, self.user)
+        self.assertEqual(bid_record.target.content_object, self.auction)
+        self.assertEqual(bid_record.extra, {'price': 11000})
+
+        auction_record = HistoryRecord.objects.get(action=HISTORY_RECORD_AUCTION_NEW)
+        self.assertEqual(auction_record.subject.content_object, self.auction)
+        self.assertIsNone(auction_record.target)
+        self.assertIsNone(auction_record.extra)
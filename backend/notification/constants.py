@@ -12,3 +12,5 @@ NOTIFICATION_CONTENT_CHOICES = (
 )
 
 WS_CHANNEL_AUCTION = 'auction'
+
+CHANNEL_SEND_EMAIL = 'send-email'
@@ -1,13 +1,57 @@
+import logging
+
 from django.conf import settings
 from django.core import mail
+from django.db import transaction
+
+from channels import Channel
+
+from notification.constants import CHANNEL_SEND_EMAIL
+
+
+logger = logging.getLogger(__name__)
+
 
+def send_email(title, content, to_addresses, bcc=None):
+    if bcc and not to_addresses:
+        # Mailgun rejects messages without a To recipient
+        to_addresses = [settings.NO_REPLY_EMAIL_ADDRESS]
 
-def send_email(title, content, to_addresses):
     with mail.get_connection() as connection:
         mail.EmailMessage(
             title,
             content,
             settings.NO_REPLY_EMAIL_ADDRESS,
             to_addresses,
+            bcc=bcc,
             connection=connection,
         ).send()
+
+
+def send_email_async(title, content, to_addresses, bcc=None):
+    """
+    Queue the email for a channels worker once the current transaction commits,
+    skipping it entirely when there are no recipients
+    """
+    if not to_addresses and not bcc:
+        return
+
+    message = {
+        'title': title,
+        'content': content,
+        'to_addresses': list(to_addresses),
+        'bcc': list(bcc) if bcc else None,
+    }
+    transaction.on_commit(lambda: Channel(CHANNEL_SEND_EMAIL).send(message))
+
+
+def send_email_consumer(message):
+    try:
+        send_email(
+            message.content['title'],
+            message.content['content'],
+            message.content['to_addresses'],
+            bcc=message.content['bcc'],
+        )
+    except Exception:
+        logger.exception('Failed to send email "%s"', message.content['title'])
@@ -3,6 +3,7 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.fields import JSONField
 from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models.signals import post_save
 
 from notification.constants import NOTIFICATION_CONTENT_CHOICES
 
@@ -36,6 +37,39 @@ class NotificationManager(models.Manager):
             extra=extra
         )
 
+    def create_notifications(self, subject_model, subject_pks, target, action, extra=None):
+        """
+        Create one notification per subject pk on the same target with bulk inserts.
+        bulk_create skips post_save, so the signal is sent explicitly for each notification.
+        """
+        if not subject_pks:
+            return []
+
+        target_notification_entity = NotificationEntity()
+        target_notification_entity.content_object = target
+        target_notification_entity.save()
+
+        subject_content_type = ContentType.objects.get_for_model(subject_model)
+        subject_notification_entities = NotificationEntity.objects.bulk_create([
+            NotificationEntity(content_type=subject_content_type, object_id=subject_pk)
+            for subject_pk in subject_pks
+        ])
+
+        notifications = self.bulk_create([
+            self.model(
+                subject=subject_notification_entity,
+                target=target_notification_entity,
+                action=action,
+                extra=extra
+            )
+            for subject_notification_entity in subject_notification_entities
+        ], batch_size=500)
+
+        for notification in notifications:
+            post_save.send(sender=self.model, instance=notification, created=True, using=self.db)
+
+        return notifications
+
 
 class Notification(models.Model):
     subject = models.ForeignKey(
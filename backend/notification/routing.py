@@ -2,9 +2,12 @@ from channels.routing import route
 
 from notification.channels import ws_connect
 from notification.channels import ws_disconnect
+from notification.constants import CHANNEL_SEND_EMAIL
+from notification.email import send_email_consumer
 
 
 channel_routing = [
     route("websocket.connect", ws_connect),
     route("websocket.disconnect", ws_disconnect),
+    route(CHANNEL_SEND_EMAIL, send_email_consumer),
 ]
@@ -0,0 +1,69 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core import mail
+
+from common.test import TestCase
+from notification.constants import CHANNEL_SEND_EMAIL
+from notification.email import send_email
+from notification.email import send_email_async
+from notification.email import send_email_consumer
+
+
+class SendEmailTests(TestCase):
+    def test_bcc_only_email_is_addressed_to_no_reply(self):
+        send_email('Title', 'Content', [], bcc=['first@example.com', 'second@example.com'])
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [settings.NO_REPLY_EMAIL_ADDRESS])
+        self.assertEqual(mail.outbox[0].bcc, ['first@example.com', 'second@example.com'])
+
+
+@patch('notification.email.Channel')
+@patch('notification.email.transaction.on_commit')
+class SendEmailAsyncTests(TestCase):
+    def test_no_recipients_queues_nothing(self, mock_on_commit, mock_channel):
+        send_email_async('Title', 'Content', [], bcc=[])
+
+        self.assertFalse(mock_on_commit.called)
+        self.assertFalse(mock_channel.called)
+
+    def test_email_is_queued_on_commit(self, mock_on_commit, mock_channel):
+        send_email_async('Title', 'Content', [], bcc=['first@example.com'])
+
+        self.assertEqual(mock_on_commit.call_count, 1)
+        self.assertFalse(mock_channel.called)
+
+        mock_on_commit.call_args[0][0]()
+
+        mock_channel.assert_called_once_with(CHANNEL_SEND_EMAIL)
+        mock_channel.return_value.send.assert_called_once_with({
+            'title': 'Title',
+            'content': 'Content',
+            'to_addresses': [],
+            'bcc': ['first@example.com'],
+        })
+
+
+class SendEmailConsumerTests(TestCase):
+    def get_message(self):
+        message = MagicMock()
+        message.content = {
+            'title': 'Title',
+            'content': 'Content',
+            'to_addresses': [],
+            'bcc': ['first@example.com'],
+        }
+        return message
+
+    @patch('notification.email.send_email')
+    def test_consumer_sends_email(self, mock_send_email):
+        send_email_consumer(self.get_message())
+
+        mock_send_email.assert_called_once_with('Title', 'Content', [], bcc=['first@example.com'])
+
+    @patch('notification.email.send_email', side_effect=Exception)
+    def test_consumer_logs_failures(self, mock_send_email):
+        with self.assertLogs('notification.email', level='ERROR'):
+            send_email_consumer(self.get_message())